@@ -15,21 +15,256 @@
 #Z* -------------------------------------------------------------------
 """
 import argparse
+import errno
+import functools
+import os
 import pathlib
-import subprocess
-import shutil
+import stat
 import sys
 
-import toml
-
-pyproject_toml = toml.load("pyproject.toml")
-PROJECT_NAME = pyproject_toml["project"]["name"]
-PROJECT_VERSION = pyproject_toml["project"]["version"]
+# subprocess, shutil, tomllib, threading and concurrent.futures are imported
+# where they are used, which keeps the CLI startup (e.g. --help) fast.
 
 PROJECT_ROOT_DIR = pathlib.Path(__file__).parent
+PYMOL_OPEN_SOURCE_DIR = PROJECT_ROOT_DIR / "vendor" / "pymol-open-source"
+VCPKG_DIR = PROJECT_ROOT_DIR / "vendor" / "vcpkg"
+VENV_PYTHON_EXECUTABLE = PROJECT_ROOT_DIR / ".venv" / "bin" / "python3.11"
 
 PYTHON_EXECUTABLE = sys.executable  # This gives the current Python executable
 DEBUG = False
+COPY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PYMOL_OPEN_SOURCE_COMMIT = "0313aeba9d75f464e4dddccc3bdbee71a5afb049"
+
+
+@functools.lru_cache(maxsize=1)
+def _pyproject() -> dict:
+  """Parses the pyproject.toml file once, on first use."""
+  import tomllib
+  with open(PROJECT_ROOT_DIR / "pyproject.toml", "rb") as f:
+    return tomllib.load(f)
+
+
+def __getattr__(name: str):
+  """Resolves PROJECT_NAME and PROJECT_VERSION lazily from the pyproject.toml file."""
+  if name == "PROJECT_NAME":
+    return _pyproject()["project"]["name"]
+  if name == "PROJECT_VERSION":
+    return _pyproject()["project"]["version"]
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _reflink_copy(src, dst, *, follow_symlinks=True):
+  """Copies a file in-kernel using copy_file_range, falling back to shutil.
+
+  On filesystems like XFS or Btrfs copy_file_range creates a reflink, so no
+  file data has to pass through userspace. Where copy_file_range is refused
+  or stops before EOF (e.g. across filesystems on older kernels), the copy
+  continues with sendfile on the already open descriptors. A copy that is
+  still short is redone with shutil. The permission bits are taken
+  from the already open file descriptors, which keeps the per-file syscall
+  count low when copying whole trees. Like shutil.copy2, the source access
+  and modification times are kept. dst must be a file path.
+  """
+  import shutil
+  tmp_complete = False
+  # The source is opened first, so a missing source leaves dst untouched
+  tmp_src_fd = os.open(src, os.O_RDONLY)
+  try:
+    tmp_src_stat = os.fstat(tmp_src_fd)
+    # Break a possible hardlink to the vendor tree instead of truncating it
+    if not _unlink_destination(dst, tmp_src_stat):
+      raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    if hasattr(os, "copy_file_range"):
+      tmp_mode = stat.S_IMODE(tmp_src_stat.st_mode)
+      tmp_dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+      try:
+        tmp_size = tmp_src_stat.st_size
+        tmp_copied = 0
+        tmp_use_sendfile = False
+        while tmp_copied < tmp_size:
+          if tmp_use_sendfile:
+            tmp_written = os.sendfile(tmp_dst_fd, tmp_src_fd, tmp_copied, tmp_size - tmp_copied)
+            if tmp_written == 0:
+              break
+          else:
+            try:
+              tmp_written = os.copy_file_range(tmp_src_fd, tmp_dst_fd, tmp_size - tmp_copied)
+            except OSError as e:
+              if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+              tmp_written = 0
+            if tmp_written == 0:
+              # Refused, or 0 before EOF (e.g. cross-filesystem on Linux 5.3-5.18)
+              tmp_use_sendfile = True
+              continue
+          tmp_copied += tmp_written
+        tmp_complete = tmp_copied == tmp_size
+        if tmp_complete:
+          # Applied last, so the fallback can still write to a read-only copy
+          os.fchmod(tmp_dst_fd, tmp_mode)
+          # Keep the source times like shutil.copy2, the freshness check in
+          # _copy_if_newer compares them
+          os.utime(tmp_dst_fd, ns=(tmp_src_stat.st_atime_ns, tmp_src_stat.st_mtime_ns))
+      finally:
+        os.close(tmp_dst_fd)
+  finally:
+    os.close(tmp_src_fd)
+  if not tmp_complete:
+    # No copy_file_range on this platform, or sendfile stopped short as well
+    shutil.copyfile(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copymode(src, dst, follow_symlinks=follow_symlinks)
+    os.utime(dst, ns=(tmp_src_stat.st_atime_ns, tmp_src_stat.st_mtime_ns))
+  return dst
+
+
+def _unlink_destination(dst, src_stat: os.stat_result) -> bool:
+  """Unlinks dst so that it is replaced instead of truncated in place.
+
+  Returns False and leaves dst alone when it already is the source file
+  (same inode), since unlinking it could delete the source itself.
+  """
+  try:
+    tmp_dst_stat = os.lstat(dst)
+  except FileNotFoundError:
+    return True
+  if os.path.samestat(src_stat, tmp_dst_stat):
+    return False
+  os.unlink(dst)
+  return True
+
+
+def _link_file(src, dst) -> None:
+  """Hardlinks a file, falling back to a (reflink) copy across filesystems."""
+  if not _unlink_destination(dst, os.stat(src)):
+    # dst already is a link to src
+    return
+  try:
+    os.link(src, dst)
+  except OSError:
+    # EXDEV, EPERM or a filesystem without hardlink support
+    _reflink_copy(src, dst)
+
+
+def _plain_copy(src, dst) -> None:
+  """Copies a file with shutil, replacing dst instead of truncating it."""
+  import shutil
+  if not _unlink_destination(dst, os.stat(src)):
+    raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+  shutil.copy2(src, dst)
+
+
+def _same_filesystem(src_dir, dst_dir) -> bool:
+  """Checks whether both directories live on the same filesystem.
+
+  Hardlinks and reflinks only work within one filesystem, so this decides
+  once per tree whether the fast paths are worth trying at all.
+  """
+  return os.stat(src_dir).st_dev == os.stat(dst_dir).st_dev
+
+
+def _copy_if_newer(copy_function, src, dst, src_stat: os.stat_result) -> None:
+  """Runs copy_function unless dst already matches src_stat in size and is not older."""
+  try:
+    tmp_dst_stat = os.stat(dst, follow_symlinks=False)
+  except FileNotFoundError:
+    copy_function(src, dst)
+    return
+  if (tmp_dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+      and tmp_dst_stat.st_size == src_stat.st_size):
+    return
+  copy_function(src, dst)
+
+
+def _collect_copy_tasks(src, dst, tasks: list, dst_dirs: set, overrides: dict, rel_dir: str = "") -> None:
+  """Collects the destination directories and file copy tasks for the src tree.
+
+  Unlike shutil.copytree this relies on the cached os.scandir entry types,
+  so regular files and directories do not cost an extra stat call each.
+  Symlinks are followed, like shutil.copytree does by default.
+  Files whose relative path is a key of overrides are copied from the
+  mapped file instead; matched keys are removed from overrides. Each task
+  carries the stat of its source, reusing the cached DirEntry stat.
+  """
+  with os.scandir(src) as tmp_entries:
+    for tmp_entry in tmp_entries:
+      tmp_dst_path = os.path.join(dst, tmp_entry.name)
+      tmp_rel_path = f"{rel_dir}{tmp_entry.name}"
+      if tmp_entry.is_dir():
+        dst_dirs.add(tmp_dst_path)
+        _collect_copy_tasks(
+          tmp_entry.path, tmp_dst_path, tasks, dst_dirs, overrides, f"{tmp_rel_path}/"
+        )
+      else:
+        tmp_override_path = overrides.pop(tmp_rel_path, None)
+        if tmp_override_path is None:
+          tasks.append((tmp_entry.path, tmp_dst_path, tmp_entry.stat()))
+        else:
+          tasks.append((os.fspath(tmp_override_path), tmp_dst_path, os.stat(tmp_override_path)))
+
+
+def _fast_copytree(src, dst, copy_function, overrides: dict | None = None) -> None:
+  """Recursively copies the src tree into dst using copy_function for files.
+
+  The destination skeleton is created up front, one mkdir per directory.
+  The file copies are I/O bound and therefore dispatched to a thread pool.
+  Files that are already up-to-date in dst (same size, not older) are
+  skipped, so repeated builds only copy what changed.
+
+  Args:
+    overrides: Maps paths relative to src (using "/") to files that are
+      copied in their place, so replaced files are only written once.
+  """
+  import concurrent.futures
+  tmp_dst = os.fspath(dst)
+  os.makedirs(tmp_dst, exist_ok=True)
+  tmp_tasks = []
+  tmp_dst_dirs = set()
+  tmp_overrides = dict(overrides or {})
+  _collect_copy_tasks(os.fspath(src), tmp_dst, tmp_tasks, tmp_dst_dirs, tmp_overrides)
+  # Overrides without a counterpart in src are added as new files
+  for tmp_rel_path, tmp_override_path in tmp_overrides.items():
+    tmp_dst_path = os.path.join(tmp_dst, tmp_rel_path)
+    tmp_dst_dir = os.path.dirname(tmp_dst_path)
+    while tmp_dst_dir != tmp_dst and tmp_dst_dir not in tmp_dst_dirs:
+      tmp_dst_dirs.add(tmp_dst_dir)
+      tmp_dst_dir = os.path.dirname(tmp_dst_dir)
+    tmp_tasks.append((os.fspath(tmp_override_path), tmp_dst_path, os.stat(tmp_override_path)))
+  # Parents are always shorter than their children
+  for tmp_dst_dir in sorted(tmp_dst_dirs, key=len):
+    try:
+      os.mkdir(tmp_dst_dir)
+    except FileExistsError:
+      pass
+  with concurrent.futures.ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as tmp_executor:
+    # Consume the results so that exceptions of the workers are re-raised
+    list(tmp_executor.map(lambda tmp_task: _copy_if_newer(copy_function, *tmp_task), tmp_tasks))
+
+
+def _print_rmtree_error(function, path, exc_info) -> None:
+  """Reports a failed deletion of the background rmtree on stderr."""
+  print(f"Could not remove {path} ({function.__name__}): {exc_info[1]}", file=sys.stderr)
+
+
+def _remove_tree_in_background(path: pathlib.Path) -> None:
+  """Renames the tree to a tombstone and deletes it in a background thread.
+
+  The rename is a single metadata update, so the original path is free
+  immediately. The thread is non-daemonic, otherwise the interpreter would
+  kill it on exit and leave the tombstone behind. Tombstones left over by
+  interrupted runs are removed by the same thread.
+  """
+  import shutil
+  import threading
+  tmp_tombstone_paths = list(path.parent.glob(f"{path.name}.trash.*"))
+  tmp_tombstone_path = path.with_name(f"{path.name}.trash.{os.urandom(4).hex()}")
+  os.rename(path, tmp_tombstone_path)
+  tmp_tombstone_paths.append(tmp_tombstone_path)
+
+  def remove_tombstones() -> None:
+    for tmp_path in tmp_tombstone_paths:
+      shutil.rmtree(tmp_path, onerror=_print_rmtree_error)
+
+  threading.Thread(target=remove_tombstones).start()
 
 
 class BuildLinuxExe:
@@ -37,122 +272,141 @@ class BuildLinuxExe:
 
   def __init__(self) -> None:
     """Constructor."""
-    self.src_path = pathlib.Path(PROJECT_ROOT_DIR / "pymol")
-    self.pymol_data_path = pathlib.Path(PROJECT_ROOT_DIR / "pymol/pymol/data")
-    self.build_script_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "pymol", "build_linux_exe.py"
-    )
-    self.license_filepath = pathlib.Path(PROJECT_ROOT_DIR / "pymol/LICENSE")
-    self.readme_filepath = pathlib.Path(PROJECT_ROOT_DIR / "pymol/README.md")
-    self.build_dir = pathlib.Path(PROJECT_ROOT_DIR / "pymol/build")
+    self.src_path = PROJECT_ROOT_DIR / "pymol"
+    self.pymol_data_path = PROJECT_ROOT_DIR / "pymol/pymol/data"
+    self.build_script_filepath = PROJECT_ROOT_DIR / "pymol" / "build_linux_exe.py"
+    self.license_filepath = PROJECT_ROOT_DIR / "pymol/LICENSE"
+    self.readme_filepath = PROJECT_ROOT_DIR / "pymol/README.md"
+    self.build_dir = PROJECT_ROOT_DIR / "pymol/build"
 
   def setup_build_environment(self) -> None:
     """Sets up a temporary build environment."""
     # <editor-fold desc="Path/Filepath definitions">
-    tmp_build_script_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "scripts/python", "build_linux_exe.py"
-    )
-    tmp_vendor_pymol_path = pathlib.Path(
-      PROJECT_ROOT_DIR / "vendor/pymol-open-source"
-    )
-    tmp_pymol_python_src_path = pathlib.Path(
-      tmp_vendor_pymol_path / "modules"
-    )
-    tmp_pymol_data_path = pathlib.Path(
-      tmp_vendor_pymol_path / "data"
-    )
-    tmp_pymol_license_filepath = pathlib.Path(
-      tmp_vendor_pymol_path / "LICENSE"
-    )
-    tmp_pymol_readme_filepath = pathlib.Path(
-      tmp_vendor_pymol_path / "README.md"
-    )
-    tmp_edited_pmg_qt_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "edited/pmg_qt" / "pymol_qt_gui.py"
-    )
-    tmp_edited_base_css_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "edited/pymol/data/pymol", "base.css"
-    )
-    tmp_edited_init_py_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "edited/pymol", "__init__.py"
-    )
-    tmp_alternative_splash_screen_filepath = pathlib.Path(
-      PROJECT_ROOT_DIR / "alternative_design" / "splash.png"
-    )
+    tmp_build_script_filepath = PROJECT_ROOT_DIR / "scripts/python" / "build_linux_exe.py"
+    tmp_pymol_python_src_path = PYMOL_OPEN_SOURCE_DIR / "modules"
+    tmp_pymol_data_path = PYMOL_OPEN_SOURCE_DIR / "data"
+    tmp_pymol_license_filepath = PYMOL_OPEN_SOURCE_DIR / "LICENSE"
+    tmp_pymol_readme_filepath = PYMOL_OPEN_SOURCE_DIR / "README.md"
+    tmp_edited_pmg_qt_filepath = PROJECT_ROOT_DIR / "edited/pmg_qt" / "pymol_qt_gui.py"
+    tmp_edited_base_css_filepath = PROJECT_ROOT_DIR / "edited/pymol/data/pymol" / "base.css"
+    tmp_edited_init_py_filepath = PROJECT_ROOT_DIR / "edited/pymol" / "__init__.py"
+    tmp_alternative_splash_screen_filepath = PROJECT_ROOT_DIR / "alternative_design" / "splash.png"
+    tmp_python_src_overrides = {
+      "pmg_qt/pymol_qt_gui.py": tmp_edited_pmg_qt_filepath,
+      "pymol/__init__.py": tmp_edited_init_py_filepath,
+    }
+    tmp_data_overrides = {
+      "pymol/base.css": tmp_edited_base_css_filepath,
+      "pymol/splash.png": tmp_alternative_splash_screen_filepath,
+    }
     # </editor-fold>
     # <editor-fold desc="Copy operations">
-    shutil.copytree(tmp_pymol_python_src_path, self.src_path, dirs_exist_ok=True)
-    shutil.copytree(tmp_pymol_data_path, self.pymol_data_path, dirs_exist_ok=True)
-    shutil.copy(tmp_build_script_filepath, self.build_script_filepath)
-    shutil.copy(tmp_pymol_license_filepath, self.license_filepath)
-    shutil.copy(tmp_pymol_readme_filepath, self.readme_filepath)
-    # <editor-fold desc="Custom file replacements">
-    shutil.copy(
-      tmp_edited_base_css_filepath,
-      pathlib.Path(tmp_pymol_data_path / "pymol", "base.css")
+    # The vendored sources are never modified in place, so both trees can
+    # share the same inodes instead of duplicating the file data. The
+    # edited files replace their vendored counterparts during the copy.
+    if _same_filesystem(PYMOL_OPEN_SOURCE_DIR, PROJECT_ROOT_DIR):
+      tmp_copy_function = _link_file
+    else:
+      tmp_copy_function = _plain_copy
+    _fast_copytree(
+      tmp_pymol_python_src_path, self.src_path, tmp_copy_function, tmp_python_src_overrides
     )
-    shutil.copy(
-      tmp_edited_pmg_qt_filepath,
-      pathlib.Path(self.src_path / "pmg_qt", "pymol_qt_gui.py")
+    _fast_copytree(
+      tmp_pymol_data_path, self.pymol_data_path, tmp_copy_function, tmp_data_overrides
     )
-    shutil.copy(
-      tmp_edited_init_py_filepath,
-      pathlib.Path(self.src_path / "pymol", "__init__.py")
-    )
-    shutil.copy(
-      tmp_alternative_splash_screen_filepath,
-      pathlib.Path(self.src_path / "pymol/data/pymol", "splash.png")
-    )
-    # </editor-fold>
+    _reflink_copy(tmp_build_script_filepath, self.build_script_filepath)
+    tmp_copy_function(tmp_pymol_license_filepath, self.license_filepath)
+    tmp_copy_function(tmp_pymol_readme_filepath, self.readme_filepath)
     # </editor-fold>
 
   def build(self) -> None:
     """Builds the PyMOL Windows EXE file."""
+    import subprocess
     self.setup_build_environment()
     subprocess.run(
       [PYTHON_EXECUTABLE, self.build_script_filepath],
-      stdout=sys.stdout, stderr=sys.stderr, text=True, cwd=self.src_path
+      cwd=self.src_path
     )
-    shutil.copytree(self.build_dir, pathlib.Path(PROJECT_ROOT_DIR / "dist"),
-                    dirs_exist_ok=True)
+    _fast_copytree(self.build_dir, PROJECT_ROOT_DIR / "dist", _reflink_copy)
     # <editor-fold desc="Clean up">
     if not DEBUG:
-      shutil.rmtree(self.src_path)
+      _remove_tree_in_background(self.src_path)
     # </editor-fold>
 
 
 def copy_pymol_sources() -> None:
   """Copies the pymol python sources from the vendor directory."""
-  tmp_src_path = pathlib.Path(PROJECT_ROOT_DIR / "src/python")
-  tmp_pymol_python_src_path = pathlib.Path(PROJECT_ROOT_DIR / "vendor/pymol-open-source/modules")
-  if not tmp_src_path.exists():
-    print("Copying the pymol python sources ...")
-    tmp_src_path.mkdir(parents=True)
-    shutil.copytree(
-      tmp_pymol_python_src_path,
-      tmp_src_path,
-      dirs_exist_ok=True
-    )
+  tmp_src_path = PROJECT_ROOT_DIR / "src/python"
+  tmp_pymol_python_src_path = PYMOL_OPEN_SOURCE_DIR / "modules"
+  # _fast_copytree creates tmp_src_path and skips files that are up-to-date
+  print("Copying the pymol python sources ...")
+  if _same_filesystem(PYMOL_OPEN_SOURCE_DIR, PROJECT_ROOT_DIR):
+    _fast_copytree(tmp_pymol_python_src_path, tmp_src_path, _link_file)
+  else:
+    _fast_copytree(tmp_pymol_python_src_path, tmp_src_path, _plain_copy)
+
+
+def _finish_pymol_open_source_setup() -> None:
+  """Checks out the pinned pymol-open-source commit and creates the generated files."""
+  import subprocess
+  # Only the blobs of the pinned commit get downloaded
+  subprocess.run(["git", "fetch", "--depth=1", "origin", PYMOL_OPEN_SOURCE_COMMIT],
+                 cwd=PYMOL_OPEN_SOURCE_DIR)
+  subprocess.run(["git", "checkout", PYMOL_OPEN_SOURCE_COMMIT],
+                 cwd=PYMOL_OPEN_SOURCE_DIR)
+  subprocess.run([str(VENV_PYTHON_EXECUTABLE),
+                  str(PROJECT_ROOT_DIR / "scripts" / "python" / "create_generated_files.py")])
+
+
+def _finish_vcpkg_setup() -> None:
+  """Bootstraps the freshly cloned vcpkg repository."""
+  import subprocess
+  subprocess.run(["chmod", "+x", "./bootstrap-vcpkg.sh"], cwd=VCPKG_DIR)
+  subprocess.run(["./bootstrap-vcpkg.sh"], shell=True, cwd=VCPKG_DIR)
 
 
 def setup_dev_env() -> None:
   """Installs the dependencies needed for building the _cmd extension module."""
+  import concurrent.futures
+  import subprocess
+  # The clones are network bound, so they run concurrently. Each clone is
+  # kept together with its name and the step that finishes its setup.
+  tmp_clones = []
   # <editor-fold desc="Setup pymol-open-source repository">
-  if not pathlib.Path(f"{PROJECT_ROOT_DIR}/vendor/pymol-open-source").exists():
-    subprocess.run(["git", "clone", "https://github.com/schrodinger/pymol-open-source.git",
-                    pathlib.Path(f"{PROJECT_ROOT_DIR}/vendor/pymol-open-source")])
-    subprocess.run(["git", "checkout", "0313aeba9d75f464e4dddccc3bdbee71a5afb049"],
-                   cwd=pathlib.Path(f"{PROJECT_ROOT_DIR}/vendor/pymol-open-source"))
-    subprocess.run([pathlib.Path(f"{PROJECT_ROOT_DIR}/.venv/bin/python3.11"), pathlib.Path(f"{PROJECT_ROOT_DIR}/scripts/python/create_generated_files.py")])
+  if not PYMOL_OPEN_SOURCE_DIR.exists():
+    tmp_clones.append((
+      "pymol-open-source",
+      subprocess.Popen(["git", "clone", "--filter=blob:none", "--no-checkout",
+                        "https://github.com/schrodinger/pymol-open-source.git",
+                        str(PYMOL_OPEN_SOURCE_DIR)]),
+      _finish_pymol_open_source_setup
+    ))
   else:
     print("pymol-open-source already setup.")
   # </editor-fold>
-  if not pathlib.Path(f"{PROJECT_ROOT_DIR}/vendor/vcpkg").exists():
-    subprocess.run(["git", "clone", "https://github.com/microsoft/vcpkg.git", pathlib.Path(f"{PROJECT_ROOT_DIR}/vendor/vcpkg")])
-    subprocess.run(["chmod", "+x", "./bootstrap-vcpkg.sh"], cwd=pathlib.Path(PROJECT_ROOT_DIR / "vendor/vcpkg"))
-    subprocess.run(["./bootstrap-vcpkg.sh"], shell=True, cwd=pathlib.Path(PROJECT_ROOT_DIR / "vendor/vcpkg"))
+  if not VCPKG_DIR.exists():
+    tmp_clones.append((
+      "vcpkg",
+      subprocess.Popen(["git", "clone", "https://github.com/microsoft/vcpkg.git", str(VCPKG_DIR)]),
+      _finish_vcpkg_setup
+    ))
   else:
     print("vcpkg already setup.")
+  tmp_post_clone_steps = []
+  tmp_failed_clones = []
+  for tmp_name, tmp_process, tmp_step in tmp_clones:
+    tmp_returncode = tmp_process.wait()
+    if tmp_returncode == 0:
+      tmp_post_clone_steps.append(tmp_step)
+    else:
+      print(f"Cloning {tmp_name} failed with exit code {tmp_returncode}, skipping its setup.",
+            file=sys.stderr)
+      tmp_failed_clones.append(tmp_name)
+  # The post clone steps touch disjoint directories
+  with concurrent.futures.ThreadPoolExecutor() as tmp_executor:
+    list(tmp_executor.map(lambda tmp_step: tmp_step(), tmp_post_clone_steps))
+  if tmp_failed_clones:
+    sys.exit(f"Setup incomplete, failed to clone: {', '.join(tmp_failed_clones)}")
 
 
 def build_linux_exe() -> None:
@@ -163,39 +417,42 @@ def build_linux_exe() -> None:
 
 def clean_install() -> None:
   """Cleans the CMake build directory and then runs the complete build process."""
-  tmp_pip_executable = pathlib.Path(PROJECT_ROOT_DIR / ".venv/bin", "pip")
-  tmp_build_dir = pathlib.Path(PROJECT_ROOT_DIR / "cmake-build-setup_py")
+  import subprocess
+  tmp_pip_executable = PROJECT_ROOT_DIR / ".venv/bin" / "pip"
+  tmp_build_dir = PROJECT_ROOT_DIR / "cmake-build-setup_py"
   copy_pymol_sources()
 
   if tmp_build_dir.exists():
-    shutil.rmtree(tmp_build_dir)
+    _remove_tree_in_background(tmp_build_dir)
   subprocess.run(
-    [tmp_pip_executable, 'install', '.'],
-    stdout=sys.stdout, stderr=sys.stderr, text=True
+    [tmp_pip_executable, 'install', '.']
   )
 
 
 def build_wheel() -> None:
   """Builds the wheel file for the python PyMOL package."""
+  import subprocess
   # Run the command using subprocess.run
   copy_pymol_sources()
-  _CMD_FROM_BUILD_DIR = pathlib.Path(PROJECT_ROOT_DIR / "cmake-build-release" / "_cmd.cpython-311-x86_64-linux-gnu.so")
-  _CMD_FROM_PRE_BUILT_DIR = pathlib.Path(PROJECT_ROOT_DIR / "pre-built" / "_cmd.cpython-311-x86_64-linux-gnu.so")
+  _CMD_FROM_BUILD_DIR = PROJECT_ROOT_DIR / "cmake-build-release" / "_cmd.cpython-311-x86_64-linux-gnu.so"
+  _CMD_FROM_PRE_BUILT_DIR = PROJECT_ROOT_DIR / "pre-built" / "_cmd.cpython-311-x86_64-linux-gnu.so"
+  # Not hardlinked: setup.py's build_ext rewrites this path in place, which
+  # would clobber the source binary through a shared inode. The reflink copy
+  # is still O(1) on CoW filesystems.
   if _CMD_FROM_BUILD_DIR.exists():
-    shutil.copy(
+    _reflink_copy(
       _CMD_FROM_BUILD_DIR,
-      pathlib.Path(PROJECT_ROOT_DIR / "src/python/pymol" / "_cmd.cpython-311-x86_64-linux-gnu.so")
+      PROJECT_ROOT_DIR / "src/python/pymol" / "_cmd.cpython-311-x86_64-linux-gnu.so"
     )
   else:
-    shutil.copy(
+    _reflink_copy(
       _CMD_FROM_PRE_BUILT_DIR,
-      pathlib.Path(PROJECT_ROOT_DIR / "src/python/pymol" / "_cmd.cpython-311-x86_64-linux-gnu.so")
+      PROJECT_ROOT_DIR / "src/python/pymol" / "_cmd.cpython-311-x86_64-linux-gnu.so"
     )
   subprocess.run(
-    [PYTHON_EXECUTABLE, 'setup.py', 'sdist', 'bdist_wheel'],
-    stdout=sys.stdout, stderr=sys.stderr, text=True
+    [PYTHON_EXECUTABLE, 'setup.py', 'sdist', 'bdist_wheel']
   )
-  shutil.rmtree(pathlib.Path(PROJECT_ROOT_DIR / "src"))
+  _remove_tree_in_background(PROJECT_ROOT_DIR / "src")
 
 
 def main() -> None:
@@ -18,19 +18,20 @@ import os
 import pathlib
 import shutil
 import subprocess
+import tomllib
 
 from setuptools import find_packages
 from setuptools import setup
 from setuptools.command.build import build
 from setuptools.command.build_ext import build_ext
 from setuptools.command.install import install
-import toml
 
-pyproject_toml = toml.load("pyproject.toml")
+PROJECT_ROOT_DIR = pathlib.Path(__file__).parent
+
+with open(PROJECT_ROOT_DIR / "pyproject.toml", "rb") as f:
+  pyproject_toml = tomllib.load(f)
 PROJECT_NAME = pyproject_toml["project"]["name"]
 PROJECT_VERSION = pyproject_toml["project"]["version"]
-
-PROJECT_ROOT_DIR = pathlib.Path(__file__).parent
 DEBUG = False  # Debug flag for not cleaning up certain build files.
 
 
@@ -73,7 +74,6 @@ setup(
     "build_ext": CMakeBuildExt
   },
   install_requires=[
-    "numpy==1.26.4",
-    "toml"
+    "numpy==1.26.4"
   ]
 )